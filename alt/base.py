@@ -41,8 +41,8 @@ Each section is marked with:
 """
 
 import logging
-from collections import OrderedDict
 from dataclasses import dataclass
+from enum import IntEnum
 from logging import Logger
 from pathlib import Path
 from typing import IO, Any, Optional
@@ -53,15 +53,13 @@ from alt.logger import get_default_logger
 
 
 # Definitions for data types and profiles
-@dataclass(frozen=True)
-class ProfileType:
+class ProfileType(IntEnum):
     UNQUANTIZED = 0
     QINT8 = 1
     QINT4 = 2
 
 
-@dataclass(frozen=True)
-class DataType:
+class DataType(IntEnum):
     FLOAT32 = 0
     FLOAT16 = 1
     QINT8 = 2
@@ -101,6 +99,34 @@ class TokenType:
             raise ValueError("Model must be of type SentencePieceProcessor.")
         self.processor = processor
 
+    def get_types(self, pieces: list) -> list:
+        """Build the full type table in one pass with the predicates bound once."""
+        is_unknown = self.processor.is_unknown
+        is_control = self.processor.is_control
+        is_byte = self.processor.is_byte
+        is_unused = self.processor.is_unused
+        types = [TokenType.NORMAL] * len(pieces)
+        for index in range(len(pieces)):
+            if is_unknown(index):
+                types[index] = TokenType.UNKNOWN
+            elif is_control(index):
+                types[index] = TokenType.CONTROL
+            elif is_byte(index):
+                types[index] = TokenType.BYTE
+            elif is_unused(index):
+                types[index] = TokenType.UNUSED
+        # Patch the special ids once instead of comparing every piece string.
+        # The predicate results keep precedence, matching get_type's ladder.
+        specials = (
+            (self.processor.bos_id(), TokenType.BOS),
+            (self.processor.eos_id(), TokenType.EOS),
+            (self.processor.pad_id(), TokenType.PAD),
+        )
+        for token_id, token_type in specials:
+            if 0 <= token_id < len(types) and types[token_id] == TokenType.NORMAL:
+                types[token_id] = token_type
+        return types
+
     def get_type(self, index: int, token: str) -> int:
         if self.processor.is_unknown(index):
             return TokenType.UNKNOWN
@@ -119,27 +145,19 @@ class TokenType:
         return TokenType.NORMAL
 
 
-@dataclass(frozen=True)
-class MagicType:
+class MagicType(IntEnum):
     ALT = 0x616C7400  # 'alt' in hex; 8 bytes
     GENERAL = 0xCAFEBABE  # 8 bytes
     PARAMETERS = 0xDEADBEEF  # 8 bytes
     TOKENIZER = 0xBADDCAFE  # 8 bytes
     TENSORS = 0xFACEFEED  # 8 bytes
     END = 0x0FFFFFFF  # 8 bytes
-    ALIGNMENT = 32  # Default 32-byte alignment
-    VERSION = 2  # ALT model file format
+    ALIGNMENT = 64  # Default 64-byte alignment; AVX-512 loads and cachelines want 64
+    VERSION = 3  # ALT model file format; bumped for the 32 -> 64 alignment change
 
     @staticmethod
     def is_valid(marker: int) -> bool:
-        return marker in {
-            MagicType.ALT,
-            MagicType.END,
-            MagicType.GENERAL,
-            MagicType.PARAMETERS,
-            MagicType.TENSORS,
-            MagicType.TOKENIZER,
-        }
+        return marker in _VALID_MARKERS
 
     @staticmethod
     def is_alt(marker: int) -> bool:
@@ -176,6 +194,22 @@ class MagicType:
         return value == MagicType.ALIGNMENT
 
 
+# calculate_padding() relies on the alignment being a power of two
+assert MagicType.ALIGNMENT & (MagicType.ALIGNMENT - 1) == 0
+
+# Hoisted so is_valid() is a single hash lookup instead of a set literal per call
+_VALID_MARKERS = frozenset(
+    {
+        MagicType.ALT,
+        MagicType.END,
+        MagicType.GENERAL,
+        MagicType.PARAMETERS,
+        MagicType.TENSORS,
+        MagicType.TOKENIZER,
+    }
+)
+
+
 @dataclass
 class CLIParams:
     alt_file: Optional[IO] = None
@@ -186,16 +220,24 @@ class CLIParams:
     profile_type: ProfileType = ProfileType.UNQUANTIZED
     context_length: int = 8192
     logger: Optional[logging.Logger] = None
+    # Shared magic writer/reader pair, lazily built by alt.magic; every
+    # section working against the same CLIParams reuses one instance
+    magic_writer: Optional[Any] = None
+    magic_reader: Optional[Any] = None
 
 
 class BaseType:
+    # Fixed attribute layout; subclasses that declare their own __slots__ stay
+    # dict-free, the rest fall back to a per-instance __dict__ as usual
+    __slots__ = ("cli_params", "magic_type")
+
     def __init__(self, cli_params: Optional[CLIParams] = None):
         self.cli_params = cli_params if cli_params else CLIParams()
         if not self.cli_params.logger:
             self.cli_params.logger = get_default_logger(self.__class__.__name__, logging.INFO)
         if self.cli_params.verbose:
             self.cli_params.logger.setLevel(logging.DEBUG)
-        self.magic_type = MagicType()
+        self.magic_type = MagicType
 
     @property
     def logger(self) -> Logger:
@@ -223,6 +265,8 @@ class BaseType:
 
 # Base model class for handling ALT format models
 class BaseModel(BaseType):
+    __slots__ = ()
+
     def __init__(self, cli_params: Optional[CLIParams] = None):
         super().__init__(cli_params)
 
@@ -232,16 +276,17 @@ class BaseModel(BaseType):
     def write_model(self) -> None:
         raise NotImplementedError("This method should be implemented by subclasses.")
 
-    def read_model(self) -> OrderedDict[str, Any]:
+    def read_model(self) -> dict[str, Any]:
         raise NotImplementedError("This method should be implemented by subclasses.")
 
 
 class BaseMagic(BaseType):
+    __slots__ = ()
+
     def __init__(self, cli_params: Optional[CLIParams] = None):
         super().__init__(cli_params)
 
     def calculate_padding(self) -> int:
-        """Calculate necessary padding to align to 32 bytes."""
-        alignment = self.magic_type.ALIGNMENT
-        position = self.alt_file.tell()
-        return (alignment - (position % alignment)) % alignment
+        """Calculate necessary padding to align to the next ALIGNMENT boundary."""
+        # ALIGNMENT is a power of two, so a branchless mask replaces the modulo
+        return -self.alt_file.tell() & (self.magic_type.ALIGNMENT - 1)
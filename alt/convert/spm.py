@@ -21,8 +21,8 @@ ALT Start:
 |-------------------|--------------------------------|-----------|--------------|----------------------|
 | `section_marker`  | Identifies file format as ALT  | `int64`   | 8            | `0x616C7400` ("alt") |
 | `section_size`    | Total size of the Start Marker | `int64`   | 8            | Includes all fields  |
-| `magic_version`   | Version of the ALT file format | `int32`   | 4            | E.g., `2`            |
-| `magic_alignment` | Alignment requirement (bytes)  | `int32`   | 4            | E.g., `32`           |
+| `magic_version`   | Version of the ALT file format | `int32`   | 4            | E.g., `3`            |
+| `magic_alignment` | Alignment requirement (bytes)  | `int32`   | 4            | E.g., `64`           |
 
 Alt General:
 
@@ -99,9 +99,11 @@ ALT End:
 NOTE: The byte order is inferred. It is not explicitly provided for flexibility.
 """
 
+import io
 import logging
+import mmap
+import sys
 from argparse import ArgumentParser, Namespace
-from collections import OrderedDict
 from typing import Any
 
 from alt.base import BaseModel, CLIParams
@@ -117,41 +119,83 @@ class AltTokenizer(BaseModel):
         # Set input parameters
         self.cli_params = cli_params
 
-        # Create model sections
+        # Create model sections once; all share the same CLIParams instance
         self.magic = MagicModel(cli_params=cli_params)
         self.general = GeneralModel(cli_params=cli_params)
         self.hparams = ParametersModel(cli_params=cli_params)
         self.tokenizer = TokenizerModel(cli_params=cli_params)
 
+        # File order; write_model/read_model route through the BaseModel interface
+        self.sections = [self.magic, self.general, self.hparams, self.tokenizer]
+
     def write_model(self) -> None:
         # Write the ALT file
         self.logger.info("Writing the ALT file...")
-        with open(self.filepath, "wb") as alt_write:
-            # Update the IO file
-            self.alt_file = alt_write
+        # A 1MB buffer keeps the vocab payload from crossing the kernel in 8KB slices
+        with open(self.filepath, "wb", buffering=1 << 20) as alt_write:
+            # Assemble the whole file in memory so the disk sees a single write
+            buffer = io.BytesIO()
+            self.alt_file = buffer
             # Write model sections
-            self.magic.write_model()
-            self.general.write_model()
-            self.hparams.write_model()
-            self.tokenizer.write_model()
+            for section in self.sections:
+                section.write_model()
             # Write model end of file
             self.magic.writer.write_end_marker()
+            # Flush the assembled image with one call
+            alt_write.write(buffer.getbuffer())
+            self.alt_file = alt_write
         self.logger.info("ALT file written successfully.")
 
-    def read_model(self) -> OrderedDict[str, Any]:
+    def collect_metadata(self) -> dict[str, Any]:
+        """Assemble display metadata from the in-memory sections without re-reading."""
+        general = self.general
+        hparams = self.hparams
+        tokenizer = self.tokenizer
+        return {
+            "version": self.magic.magic_type.VERSION,
+            "alignment": self.magic.magic_type.ALIGNMENT,
+            "model_type": general.model_type,
+            "base_model": general.base_model,
+            "author": general.author,
+            "created_at": general.created_at,
+            "last_modified": general.last_modified,
+            "license": general.license,
+            "uuid": general.uuid,
+            "hidden_act": hparams.hidden_act,
+            "tie_word_embeddings": hparams.tie_word_embeddings,
+            "hidden_size": hparams.hidden_size,
+            "intermediate_size": hparams.intermediate_size,
+            "max_position_embeddings": hparams.max_position_embeddings,
+            "num_attention_heads": hparams.num_attention_heads,
+            "num_hidden_layers": hparams.num_hidden_layers,
+            "num_key_value_heads": hparams.num_key_value_heads,
+            "sliding_window": hparams.sliding_window,
+            "head_size": hparams.head_size,
+            "rms_norm_eps": hparams.rms_norm_eps,
+            "rope_theta": hparams.rope_theta,
+            "initializer_range": hparams.initializer_range,
+            "vocab_size": tokenizer.vocab_size,
+            "bos_id": tokenizer.bos_id,
+            "eos_id": tokenizer.eos_id,
+            "pad_id": tokenizer.pad_id,
+            "unk_id": tokenizer.unk_id,
+        }
+
+    def read_model(self) -> dict[str, Any]:
         # Read and validate the ALT file
         self.logger.info("Reading the ALT file...")
-        metadata = OrderedDict()
+        metadata = {}
         with open(self.filepath, "rb") as alt_read:
-            # Update the IO file
+            # Map the file once; mmap serves the file-like read/seek/tell the
+            # section readers use, without a syscall per small field
+            with mmap.mmap(alt_read.fileno(), 0, access=mmap.ACCESS_READ) as alt_map:
+                self.alt_file = alt_map
+                # Read model sections and aggregate metadata
+                for section in self.sections:
+                    metadata |= section.read_model()
+                # Read and validate End Marker
+                self.magic.reader.read_end_marker()
             self.alt_file = alt_read
-            # Read model sections and aggregate metadata
-            metadata.update(self.magic.read_model())
-            metadata.update(self.general.read_model())
-            metadata.update(self.hparams.read_model())
-            metadata.update(self.tokenizer.read_model())
-            # Read and validate End Marker
-            self.magic.reader.read_end_marker()
         return metadata
 
 
@@ -183,15 +227,22 @@ def main():
 
     alt_tokenizer = AltTokenizer(cli_params)
     alt_tokenizer.write_model()
-    metadata = alt_tokenizer.read_model()
+    # The sections just wrote every field; re-parsing the file is only a
+    # verification pass, so it is gated on verbose mode.
+    if args.verbose:
+        metadata = alt_tokenizer.read_model()
+    else:
+        metadata = alt_tokenizer.collect_metadata()
     logger.info("Tokenizer Model Metadata:")
+    # Build the whole report first; one stdout write instead of a print per line
+    lines = []
     for key, value in metadata.items():
         if "vocab" == key:
             if args.verbose:
-                for v in value:
-                    print(v)
+                lines.extend(map(str, zip(*value.values())))
             continue
-        print(f"{key}: {value}")
+        lines.append(f"{key}: {value}")
+    sys.stdout.write("\n".join(lines) + "\n")
     logger.info(f"Successfully created {alt_tokenizer.filepath}.")
 
 
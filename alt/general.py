@@ -39,7 +39,7 @@ The General Section consists of three parts: **Header**, **Fields**, and **Align
 
 ### **Alignment**
 
-The section must align to the next 32-byte boundary using padding. Add `0x00` bytes as necessary to reach the required alignment.
+The section must align to the next 64-byte boundary using padding. Add `0x00` bytes as necessary to reach the required alignment.
 
 ### **Parsing Steps**
 
@@ -52,67 +52,118 @@ The section must align to the next 32-byte boundary using padding. Add `0x00` by
      - Read the 4-byte length prefix.
      - Parse the string data of the specified length.
 4. **Apply Alignment**:
-   - Add padding with `0x00` bytes as necessary to align to the next 32-byte boundary.
+   - Add padding with `0x00` bytes as necessary to align to the next 64-byte boundary.
 """
 
 import struct
-from collections import OrderedDict
+import sys
 from typing import Any, Optional
 from uuid import uuid4
 
 from alt.base import BaseModel, CLIParams
 from alt.loader import ModelLoader
-from alt.magic import MagicReader, MagicWriter
+from alt.magic import get_magic_reader, get_magic_writer
+
+# Precompiled little-endian length prefix; "<i" pins the width so the on-disk
+# format cannot drift with native struct sizes
+_S_I = struct.Struct("<i")
+
+# uuid4 strings are always 36 bytes, so the section tail has a fixed layout
+# and packs in one call
+_S_UUID = struct.Struct("<i36s")
 
 
 class GeneralModel(BaseModel):
+    # Slots keep attribute access a fixed-offset load and drop the instance
+    # __dict__ when many models are converted in one run
+    __slots__ = (
+        "magic_writer",
+        "magic_reader",
+        "model_info",
+        "model_type",
+        "_model_type_data",
+        "model_type_len",
+        "base_model",
+        "_base_model_data",
+        "base_model_len",
+        "author",
+        "_author_data",
+        "author_len",
+        "created_at",
+        "_created_at_data",
+        "created_at_len",
+        "last_modified",
+        "_last_modified_data",
+        "last_modified_len",
+        "license",
+        "_license_data",
+        "license_len",
+        "uuid",
+        "_uuid_data",
+        "uuid_len",
+        "_size",
+    )
+
     def __init__(self, cli_params: Optional[CLIParams] = None):
         # Inherit self.cli_params and self.magic_type
         super().__init__(cli_params)
 
         # Add the magic writer and reader
-        self.magic_writer = MagicWriter(cli_params)
-        self.magic_reader = MagicReader(cli_params)
+        self.magic_writer = get_magic_writer(cli_params)
+        self.magic_reader = get_magic_reader(cli_params)
 
-        # Get huggingface_hub.hf_api.ModelInfo
+        # Get the ModelMetadata snapshot of the repo metadata
         self.model_info = ModelLoader(cli_params).load_model_info()
 
-        # Extract the model info from the repo
-        self.model_type = self.model_info.config["model_type"]
-        self.model_type_len = len(self.model_type)
+        # Extract the model info from the snapshot. Each field is encoded once
+        # here; the length prefix is the UTF-8 byte count, not the character
+        # count, so non-ASCII metadata cannot corrupt the layout.
+        self.model_type = self.model_info.model_type
+        self._model_type_data = self.model_type.encode("utf-8")
+        self.model_type_len = len(self._model_type_data)
 
-        self.base_model = self.model_info.card_data.base_model
-        self.base_model_len = len(self.base_model)
+        self.base_model = self.model_info.base_model
+        self._base_model_data = self.base_model.encode("utf-8")
+        self.base_model_len = len(self._base_model_data)
 
         self.author = self.model_info.author
-        self.author_len = len(self.author)
+        self._author_data = self.author.encode("utf-8")
+        self.author_len = len(self._author_data)
 
-        self.created_at = self.model_info.created_at.isoformat()
-        self.created_at_len = len(self.created_at)
+        self.created_at = self.model_info.created_at
+        self._created_at_data = self.created_at.encode("utf-8")
+        self.created_at_len = len(self._created_at_data)
 
-        self.last_modified = self.model_info.last_modified.isoformat()
-        self.last_modified_len = len(self.last_modified)
+        self.last_modified = self.model_info.last_modified
+        self._last_modified_data = self.last_modified.encode("utf-8")
+        self.last_modified_len = len(self._last_modified_data)
 
-        self.license = self.model_info.card_data.license
-        self.license_len = len(self.license)
+        self.license = self.model_info.license
+        self._license_data = self.license.encode("utf-8")
+        self.license_len = len(self._license_data)
 
         # Generate a unique identifier for the model file
         self.uuid = str(uuid4())  # Convert UUID to string
-        self.uuid_len = len(self.uuid)
+        self._uuid_data = self.uuid.encode("utf-8")
+        self.uuid_len = len(self._uuid_data)
+
+        # Every field is fixed after construction, so the size is too
+        self._size = 4 * 7 + (
+            self.model_type_len
+            + self.base_model_len
+            + self.author_len
+            + self.created_at_len
+            + self.last_modified_len
+            + self.license_len
+            + self.uuid_len
+        )
 
     def calculate_size(self) -> int:
         """
         Calculate the size of the General Section.
         This includes the length prefix (4 bytes) and actual string data for each field.
         """
-        size = 4 + self.author_len
-        size += 4 + self.base_model_len
-        size += 4 + self.model_type_len
-        size += 4 + self.created_at_len
-        size += 4 + self.last_modified_len
-        size += 4 + self.license_len
-        size += 4 + self.uuid_len
-        return size
+        return self._size
 
     def write_model(self) -> None:
         """
@@ -121,35 +172,44 @@ class GeneralModel(BaseModel):
         # Set the section marker and size
         self.magic_writer.write_section_marker(self.magic_type.GENERAL, self.calculate_size())
 
-        # Write metadata fields with their length prefixes
+        # Assemble metadata fields with their length prefixes into one buffer
         fields = [
-            (self.model_type_len, self.model_type),
-            (self.base_model_len, self.base_model),
-            (self.author_len, self.author),
-            (self.created_at_len, self.created_at),
-            (self.last_modified_len, self.last_modified),
-            (self.license_len, self.license),
-            (self.uuid_len, self.uuid),
+            (self.model_type_len, self._model_type_data),
+            (self.base_model_len, self._base_model_data),
+            (self.author_len, self._author_data),
+            (self.created_at_len, self._created_at_data),
+            (self.last_modified_len, self._last_modified_data),
+            (self.license_len, self._license_data),
         ]
-        for length, value in fields:
-            self.alt_file.write(struct.pack("i", length))  # Write length prefix (int32)
-            self.alt_file.write(value.encode("utf-8"))  # Write string data
+        buffer = bytearray()
+        pack = _S_I.pack
+        for length, data in fields:
+            buffer += pack(length)  # Length prefix (int32)
+            buffer += data  # UTF-8 string data, encoded once in __init__
+
+        # The uuid tail is fixed-width; emit prefix and payload in one pack
+        buffer += _S_UUID.pack(self.uuid_len, self._uuid_data)
+
+        # One write for the whole section instead of one per field
+        self.alt_file.write(buffer)
 
         # Write alignment padding
         self.magic_writer.write_alignment()
 
-    def read_model(self) -> OrderedDict[str, Any]:
+    def read_model(self) -> dict[str, Any]:
         """Read the General Section data from the file."""
         # Get the section marker and size
         marker, size = self.magic_reader.read_section_marker()
         # Validate the marker and size
         if not self.magic_type.is_general(marker):
             raise ValueError(f"Invalid section marker: {marker}")
-        if size != self.calculate_size():
-            raise ValueError(f"Section size mismatch: expected {self.calculate_size()}, got {size}")
+        expected = self._size
+        if size != expected:
+            raise ValueError(f"Section size mismatch: expected {expected}, got {size}")
 
-        # Read the general metadata from the file
-        metadata = OrderedDict()
+        # Read the whole section once, then parse the fields in memory
+        blob = self.alt_file.read(size)
+        metadata = {}
         fields = [
             "model_type",
             "base_model",
@@ -159,10 +219,16 @@ class GeneralModel(BaseModel):
             "license",
             "uuid",
         ]
+        offset = 0
+        unpack_from = _S_I.unpack_from
+        intern = sys.intern
         for field in fields:
-            length = struct.unpack("i", self.alt_file.read(4))[0]
-            value = self.alt_file.read(length).decode("utf-8")
-            metadata[field] = value
+            length = unpack_from(blob, offset)[0]
+            offset += 4
+            value = blob[offset : offset + length].decode("utf-8")
+            offset += length
+            # Intern the short metadata strings so repeated loads share storage
+            metadata[field] = intern(value)
 
         # Read alignment padding
         self.magic_reader.read_alignment()
@@ -197,7 +263,9 @@ if __name__ == "__main__":
 
     # Write the ALT file
     logger.info("Writing the ALT file...")
-    with open(path / filename, "wb") as alt_write:
+    # Large write buffer: section writes accumulate in user space and reach
+    # the kernel in megabyte-sized chunks instead of one syscall per section
+    with open(path / filename, "wb", buffering=1 << 20) as alt_write:
         cli_params.alt_file = alt_write
 
         # Write Start Section
@@ -5,54 +5,68 @@ Usage Example:
     python -m alt.inspect.hash -m models/mistralai/Mistral-7B-Instruct-v0.1
 """
 
+import os
 import sys
 from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import blake2b
 from pathlib import Path
 
 import torch
 
+from alt.loader import sorted_part_paths
 
-def load_model_parts(model_dir: str, pattern: str = "pytorch_model-*.bin") -> list[dict]:
-    parts = []
-    model_path = Path(model_dir)
-    for part_path in sorted(model_path.glob(pattern)):
-        try:
-            model_part = torch.load(part_path, map_location="cpu", weights_only=True)
-            parts.append(model_part)
-            print(f"Loaded model part: {part_path.name}")
-        except Exception as e:
-            print(f"Error loading model part {part_path}: {e}")
-            sys.exit(1)
 
-    if not parts:
-        print(f"Error: No model parts found in {model_dir} matching pattern '{pattern}'")
+def load_model_part(part_path: Path) -> dict:
+    try:
+        # mmap keeps shard storage in the page cache rather than the heap
+        model_part = torch.load(part_path, map_location="cpu", weights_only=True, mmap=True)
+        print(f"Loaded model part: {part_path.name}")
+        return model_part
+    except Exception as e:
+        print(f"Error loading model part {part_path}: {e}")
         sys.exit(1)
 
-    return parts
 
+def hash_tensor(item: tuple[str, torch.Tensor]) -> tuple[str, str]:
+    tensor_name, tensor_weights = item
+    tensor_hash = blake2b(digest_size=32)
+    # copy=False skips the cast when the tensor is already float16;
+    # contiguous() guarantees numpy() can view the storage directly
+    np_tensor = tensor_weights.detach().to(torch.float16, copy=False).contiguous().numpy()
 
-def calculate_model_hash(model_parts: list[dict], chunk_size: int = 4096) -> str:
-    all_hashes = blake2b(digest_size=32)  # 32-byte digest size (adjustable)
-    for model_part in model_parts:
-        for tensor_name, tensor_weights in model_part.items():
-            tensor_hash = blake2b(digest_size=32)
-            np_tensor = tensor_weights.to(torch.float16).cpu().numpy().astype("float16")
+    # Hash the raw storage through the buffer protocol; no tobytes() copy
+    tensor_hash.update(memoryview(np_tensor).cast("B"))
 
-            # Process tensor in chunks for efficiency
-            byte_data = np_tensor.tobytes()
-            for i in range(0, len(byte_data), chunk_size):
-                tensor_hash.update(byte_data[i : i + chunk_size])
+    # Hash tensor name and shape as well
+    tensor_hash.update(tensor_name.encode())
+    tensor_hash.update(str(np_tensor.shape).encode())
 
-            # Hash tensor name and shape as well
-            tensor_hash.update(tensor_name.encode())
-            tensor_hash.update(str(np_tensor.shape).encode())
+    return tensor_name, tensor_hash.hexdigest()
 
-            layer_hash = tensor_hash.hexdigest()
-            print(f"{tensor_name} hash: {layer_hash}")
 
-            # Aggregate tensor hash to the overall hash
-            all_hashes.update(layer_hash.encode())
+def calculate_model_hash(model_dir: str, pattern: str = "pytorch_model-*.bin") -> str:
+    part_paths = sorted_part_paths(model_dir, pattern)
+    if not part_paths:
+        print(f"Error: No model parts found in {model_dir} matching pattern '{pattern}'")
+        sys.exit(1)
+
+    all_hashes = blake2b(digest_size=32)  # 32-byte digest size (adjustable)
+    # Load, hash, and release one shard at a time; peak memory stays at a
+    # single shard instead of the whole model. blake2b.update releases the
+    # GIL on large buffers, so the per-tensor work parallelizes on threads;
+    # executor.map yields in submission order, keeping the digest stable.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for part_path in part_paths:
+            model_part = load_model_part(part_path)
+            for tensor_name, layer_hash in executor.map(hash_tensor, model_part.items()):
+                print(f"{tensor_name} hash: {layer_hash}")
+
+                # Aggregate tensor hash to the overall hash
+                all_hashes.update(layer_hash.encode())
+
+            # Release the shard before loading the next one
+            del model_part
 
     return all_hashes.hexdigest()
 
@@ -73,20 +87,12 @@ def parse_args() -> Namespace:
         default="pytorch_model-*.bin",
         help="File pattern for model parts (default: 'pytorch_model-*.bin')",
     )
-    parser.add_argument(
-        "-c",
-        "--chunk-size",
-        type=int,
-        default=4096,
-        help="The size per chunk for each tensor. Default is 4096.",
-    )
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
-    model_parts = load_model_parts(args.model_dir, args.pattern)
-    hash_sum = calculate_model_hash(model_parts)
+    hash_sum = calculate_model_hash(args.model_dir, args.pattern)
     print(f"Hash sum of entire model: {hash_sum}")
 
 
@@ -37,12 +37,21 @@ def calculate_tokenizer_size(
     print(f"PAD ID        : {tokenizer.pad_id()}")
     print(f"UNK ID        : {tokenizer.unk_id()}")
 
+    # Fast path: no per-token diagnostics requested, so batch the FFI call
+    # and keep the accounting in a single generator sum
+    if not verbose and limit is None and inspect_token is None:
+        pieces = tokenizer.id_to_piece(list(range(tokenizer.vocab_size())))
+        total_size += sum(4 + len(piece.encode("utf-8")) for piece in pieces)
+        print(f"Total Tokenizer Size: {total_size} bytes")
+        return total_size
+
     # Process each token up to the specified limit
+    id_to_piece = tokenizer.id_to_piece
     for i in range(tokenizer.vocab_size()):
         if limit and i >= limit:
             break
 
-        token = tokenizer.id_to_piece(i).encode("utf-8")
+        token = id_to_piece(i).encode("utf-8")
         token_size = 4 + len(token)  # 4 bytes for length + UTF-8 token data
         total_size += token_size
 
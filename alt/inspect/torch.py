@@ -9,11 +9,12 @@ Example Usage:
 
 import sys
 from argparse import ArgumentParser, Namespace
-from pathlib import Path
 from typing import Dict
 
 import torch
 
+from alt.loader import sorted_part_paths
+
 
 # Get each part of a multi-file PyTorch model
 def read_torch_model_parts(
@@ -21,7 +22,7 @@ def read_torch_model_parts(
 ) -> list[Dict[str, torch.Tensor]]:
     """Load the model parts from a given directory."""
     # Get the model parts from a given path
-    model_paths = sorted(Path(model_dir).glob(pattern))
+    model_paths = sorted_part_paths(model_dir, pattern)
     if not model_paths:
         print(f"Error: No model parts found in {model_dir} matching pattern '{pattern}'")
         sys.exit(1)
@@ -44,20 +45,25 @@ def read_torch_model_parts(
 
 def print_layer_names(model_parts: list, verbose: bool = False):
     """Print the names of the layers in the model."""
+    # Collect the report first; one stdout write instead of a print per layer
+    lines = []
     for i, part in enumerate(model_parts):
         if verbose:
-            print(f"Model Part {i}: Layer Names")
+            lines.append(f"Model Part {i}: Layer Names")
         for name in part.keys():
-            print(f"Layer: {name}")
+            lines.append(f"Layer: {name}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_layer_shapes(model_parts: list, verbose: bool = False):
     """Print the shapes of the layers in the model."""
+    lines = []
     for i, part in enumerate(model_parts):
         if verbose:
-            print(f"Model Part {i}: Layer Shapes")
+            lines.append(f"Model Part {i}: Layer Shapes")
         for name, weight in part.items():
-            print(f"Layer: {name}, Shape: {weight.shape}")
+            lines.append(f"Layer: {name}, Shape: {weight.shape}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_layer_weights(model_parts: list, threshold: int = 10, verbose: bool = False):
@@ -69,30 +75,38 @@ def print_layer_weights(model_parts: list, threshold: int = 10, verbose: bool =
             if verbose:
                 print(f"Layer: {name}, Shape: {weight.shape}, Weights: {weight}")
             else:
+                # Fused reduction: one pass over the tensor instead of two
+                std, mean = torch.std_mean(weight)
                 print(
                     f"Layer: {name}, "
                     f"Shape: {weight.shape}, "
                     "Weights Summary: "
-                    f"Mean={weight.mean().item()}, "
-                    f"Std={weight.std().item()}"
+                    f"Mean={mean.item()}, "
+                    f"Std={std.item()}"
                 )
 
 
 def print_layer_block_count(model_parts: list, verbose: bool = False):
-    layer_indices = set()
+    seen_mask = 0  # bit i set once block i has been counted
     layers = 0  # total number of blocks
     sub_layers = 0  # total number of layers within a single block
     for i, part in enumerate(model_parts):
         if verbose:
             print(f"Model Part {i}: Block Count")
         for name, tensor in part.items():
-            keys = name.split(".")
-            is_layer = len(keys) > 2 and keys[1] == "layers"
+            # Only the first three dotted segments matter; partition walks
+            # them without allocating a list of the remaining segments
+            _, _, rest = name.partition(".")
+            head, sep, rest = rest.partition(".")
+            is_layer = bool(sep) and head == "layers"
             # Check if this is a layer with an index (i.e., a standard numbered layer)
             if is_layer:
-                layer_index = keys[2]
-                if layer_index not in layer_indices:
-                    layer_indices.add(layer_index)
+                try:
+                    bit = 1 << int(rest.partition(".")[0])
+                except ValueError:
+                    continue  # non-numeric index, e.g. "layers.final"
+                if not seen_mask & bit:
+                    seen_mask |= bit
                     layers += 1
                     sub_layers = 0
                 sub_layers += 1
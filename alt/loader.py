@@ -5,41 +5,107 @@ Loads required model data from a given directory.
 """
 
 import json
+import os
+import re
 import sys
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List
 
 import torch
 from huggingface_hub import model_info
-from huggingface_hub.hf_api import ModelInfo
 from sentencepiece import SentencePieceProcessor
 
 from alt.base import BaseType, CLIParams
 from alt.logger import get_default_logger
 
 
+@dataclass(frozen=True)
+class ModelMetadata:
+    """Immutable snapshot of the hub metadata consumed by the General Section.
+
+    Keeping our own record decouples the writers from the shape of
+    huggingface_hub's ModelInfo and makes the on-disk cache plain JSON.
+    """
+
+    model_type: str
+    base_model: str
+    author: str
+    created_at: str
+    last_modified: str
+    license: str
+
+
+def _natural_key(name: str) -> list:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def sorted_part_paths(model_dir, pattern: str = "pytorch_model-*.bin") -> List[Path]:
+    """List shard paths matching the pattern in natural (numeric-aware) order.
+
+    A plain lexicographic sort puts pytorch_model-10.bin before
+    pytorch_model-9.bin; embedded numbers are compared as integers instead.
+    """
+    names = [entry.name for entry in os.scandir(model_dir) if fnmatch(entry.name, pattern)]
+    names.sort(key=_natural_key)
+    directory = Path(model_dir)
+    return [directory / name for name in names]
+
+
+@lru_cache(maxsize=4)
+def _read_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    # Keyed on mtime so every section model sharing a directory reuses one
+    # parsed dict, and an edited config.json still invalidates the entry
+    with open(config_path, "r") as f:
+        return json.load(f)
+
+
 class ModelLoader(BaseType):
     def __init__(self, cli_params: CLIParams):
         super().__init__(cli_params)
 
-    def load_model_info(self) -> ModelInfo:
-        """Loads metadata from the Hugging Face repo."""
+    def load_model_info(self) -> ModelMetadata:
+        """Loads metadata from the Hugging Face repo, cached on disk."""
+        # The repo metadata is immutable for a downloaded snapshot; skip the
+        # network round-trip when a cached copy sits next to the model files.
+        cache_path = self.directory / "model_info.json"
+        if cache_path.exists():
+            with cache_path.open("r") as f:
+                metadata = ModelMetadata(**json.load(f))
+            self.logger.debug("Model info loaded from cache.")
+            return metadata
+
         repo_name = "/".join(self.directory.parts[-2:])
         try:
             info = model_info(repo_name)
             self.logger.debug("Model info loaded successfully.")
         except Exception:
             self.logger.error("Use huggingface-cli login to register metadata.")
-        return info
+            sys.exit(1)
+
+        # Snapshot only the fields the General Section serializes
+        metadata = ModelMetadata(
+            model_type=info.config["model_type"],
+            base_model=info.card_data.base_model,
+            author=info.author,
+            created_at=info.created_at.isoformat(),
+            last_modified=info.last_modified.isoformat(),
+            license=info.card_data.license,
+        )
+        with cache_path.open("w") as f:
+            json.dump(asdict(metadata), f)
+        return metadata
 
     def load_model_config(self) -> Dict[str, Any]:
         """Loads model configuration from config.json."""
         config_path = self.directory / "config.json"
         try:
-            with config_path.open("r") as f:
-                self.config = json.load(f)
-                self.logger.debug("Model configuration loaded successfully.")
+            self.config = _read_config(str(config_path), config_path.stat().st_mtime_ns)
+            self.logger.debug("Model configuration loaded successfully.")
         except FileNotFoundError:
-            self.logger.error(f"config.json not found in {config_path}")
+            self.logger.error("config.json not found in %s", config_path)
             sys.exit(1)
         except json.JSONDecodeError:
             self.logger.error("Could not decode config.json")
@@ -53,20 +119,24 @@ class ModelLoader(BaseType):
             self.tokenizer = SentencePieceProcessor(model_file=str(tokenizer_path))
             self.logger.debug("Tokenizer model loaded successfully.")
         except Exception as e:
-            self.logger.error(f"Failed to load SentencePiece tokenizer: {e}")
+            self.logger.error("Failed to load SentencePiece tokenizer: %s", e)
             sys.exit(1)
         return self.tokenizer
 
     def load_model_parts(self, pattern="pytorch_model-*.bin") -> List[Dict[str, torch.Tensor]]:
         """Loads model weight parts according to a specified file pattern."""
         model_parts = []
-        for part_path in sorted(self.directory.glob(pattern)):
+        for part_path in sorted_part_paths(self.directory, pattern):
             try:
-                model_part = torch.load(part_path, map_location="cpu", weights_only=True)
+                # mmap backs the tensors with the page cache instead of
+                # copying every shard into anonymous memory up front
+                model_part = torch.load(
+                    part_path, map_location="cpu", weights_only=True, mmap=True
+                )
                 model_parts.append(model_part)
-                self.logger.debug(f"Loaded model part: {part_path.name}")
+                self.logger.debug("Loaded model part: %s", part_path.name)
             except Exception as e:
-                self.logger.error(f"Failed to load model part {part_path}: {e}")
+                self.logger.error("Failed to load model part %s: %s", part_path, e)
                 sys.exit(1)
 
         if not model_parts:
@@ -10,6 +10,10 @@ from logging import Logger
 
 LOGGER_FORMAT = "%(asctime)s - %(filename)s:%(lineno)d - %(levelname)s - %(message)s"
 
+# Configured loggers by name; skips the hasHandlers() hierarchy walk on
+# repeat calls
+_LOGGERS: dict[str, Logger] = {}
+
 
 def get_default_logger(
     name: str = None,
@@ -17,11 +21,17 @@ def get_default_logger(
     fmt: str = LOGGER_FORMAT,
 ) -> Logger:
     """Get a default logger instance with specified configuration."""
-    logger = logging.getLogger(name if name else "alt")
+    key = name if name else "alt"
+    logger = _LOGGERS.get(key)
+    if logger is not None:
+        return logger
+
+    logger = logging.getLogger(key)
     if not logger.hasHandlers():
         handler = logging.StreamHandler(stream=sys.stdout)
         formatter = logging.Formatter(fmt)
         handler.setFormatter(formatter)
         logger.addHandler(handler)
         logger.setLevel(level)
+    _LOGGERS[key] = logger
     return logger
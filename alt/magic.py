@@ -3,9 +3,9 @@ Module: alt/magic.py
 
 ## File Alignment
 
-Each section aligns to a 32-byte boundary. The required padding is calculated as follows:
+Each section aligns to a 64-byte boundary. The required padding is calculated as follows:
 
-- $\text{alignment} = 32$
+- $\text{alignment} = 64$
 - $\text{position} = \text{file.tell()}$
 - $\text{offset} = \text{position} \mod \text{alignment}$
 - $\text{pad} = (\text{alignment} - \text{offset}) \mod \text{alignment}$
@@ -15,9 +15,9 @@ Each section aligns to a 32-byte boundary. The required padding is calculated as
 
 For a section ending at byte position $68$:
 
-- $\text{offset} = 68 \mod 32 = 4$
-- $\text{pad} = (32 - 4) \mod 32 = 28$
-- **Result**: Insert $28$ bytes of `0x00` padding.
+- $\text{offset} = 68 \mod 64 = 4$
+- $\text{pad} = (64 - 4) \mod 64 = 60$
+- **Result**: Insert $60$ bytes of `0x00` padding.
 
 ## **Start Marker**
 
@@ -38,13 +38,13 @@ The Start Marker includes the **Header** and **Fields**, defining the format ver
 
 | Field             | Description                    | Data Type | Size (bytes) | Notes      |
 |-------------------|--------------------------------|-----------|--------------|------------|
-| `magic_version`   | Version of the ALT file format | `int32`   | 4            | E.g., `2`  |
-| `magic_alignment` | Alignment requirement (bytes)  | `int32`   | 4            | E.g., `32` |
+| `magic_version`   | Version of the ALT file format | `int32`   | 4            | E.g., `3`  |
+| `magic_alignment` | Alignment requirement (bytes)  | `int32`   | 4            | E.g., `64` |
 
 ### **Alignment**
 
 - The Start Marker does not include padding between fields.
-- The entire section must align to the next 32-byte boundary. Add `0x00` bytes after the last field if necessary to meet alignment requirements.
+- The entire section must align to the next 64-byte boundary. Add `0x00` bytes after the last field if necessary to meet alignment requirements.
 
 ### **Parsing Steps**
 
@@ -57,7 +57,7 @@ The Start Marker includes the **Header** and **Fields**, defining the format ver
    - Read `magic_version` to identify the ALT file format version.
    - Read `magic_alignment` to determine the alignment requirements for subsequent sections.
 4. **Apply Alignment**:
-   - Calculate the necessary padding to ensure alignment with the next 32-byte boundary.
+   - Calculate the necessary padding to ensure alignment with the next 64-byte boundary.
    - Add `0x00` bytes as required.
 
 ## **End Marker**
@@ -89,8 +89,8 @@ This summary consolidates the structure and layout of the ALT file format, showi
 |---------|-------------------------|----------|-------------------------------------------------------|
 | 0       | Start Marker            | 16       | Magic number (`0x616C7400`, "alt") and `section_size` |
 | 16      | Fields                  | 8        | `magic_version` and `magic_alignment`                  |
-| 24      | Padding                 | 8        | Padding to align to the next 32-byte boundary         |
-| 32      | General Section         | Variable | Metadata, including name, author, and UUID            |
+| 24      | Padding                 | 40       | Padding to align to the next 64-byte boundary         |
+| 64      | General Section         | Variable | Metadata, including name, author, and UUID            |
 | Aligned | HyperParameters Section | Variable | Model hyperparameters prefixed by section header      |
 | Aligned | Tokenizer Section       | Variable | Vocabulary, token types, and special token IDs        |
 | Aligned | Tensor Section          | Variable | Tensor metadata and packed binary data                |
@@ -98,7 +98,7 @@ This summary consolidates the structure and layout of the ALT file format, showi
 
 ### Notes:
 
-- **Aligned Sections**: Each section starts on a 32-byte boundary following its predecessor.
+- **Aligned Sections**: Each section starts on a 64-byte boundary following its predecessor.
 - **Padding**: Padding is only applied where necessary to reach the alignment requirement, and sections do not contain intra-field padding.
 - **Variable Size Sections**: Sections like General, Tokenizer, and Tensors vary in size depending on model-specific details but are clearly marked by `section_marker` and `section_size`.
 - **Byte Order**: The byte order is inferred. It is not explicitly provided for flexibility.
@@ -106,10 +106,19 @@ This summary consolidates the structure and layout of the ALT file format, showi
 
 import os
 import struct
-from collections import OrderedDict
 from typing import Any, Optional, Tuple
 
-from alt.base import BaseMagic, BaseModel, CLIParams
+from alt.base import BaseMagic, BaseModel, CLIParams, MagicType
+
+# Reusable padding buffer; sliced instead of allocating fresh zero bytes per section
+_PAD = b"\x00" * MagicType.ALIGNMENT
+
+# Precompiled little-endian structs for the marker and field primitives
+_S_Q = struct.Struct("<q")
+_S_2Q = struct.Struct("<2q")
+
+# The whole Start Marker is fixed-layout: marker, size, version, alignment
+_S_START = struct.Struct("<2q2i")
 
 
 class MagicWriter(BaseMagic):
@@ -120,21 +129,28 @@ class MagicWriter(BaseMagic):
         """Write alignment padding to the ALT file."""
         padding_needed = self.calculate_padding()
         if padding_needed > 0:
-            self.alt_file.write(b"\x00" * padding_needed)
-            self.logger.debug(f"Aligned offset with {padding_needed} bytes of padding.")
+            self.alt_file.write(_PAD[:padding_needed])
+            self.logger.debug("Aligned offset with %d bytes of padding.", padding_needed)
+
+    def pack_section_marker(self, marker: int, size: int) -> bytes:
+        """Pack a section marker and its size without touching the file."""
+        return _S_2Q.pack(marker, size)  # 8 bytes each
+
+    def pack_alignment(self, position: int) -> bytes:
+        """Zero padding that aligns the given absolute position."""
+        return _PAD[: -position & (self.magic_type.ALIGNMENT - 1)]
 
     def write_section_marker(self, marker: int, size: int) -> None:
         """Write a section marker and its size."""
         position = self.alt_file.tell()
-        self.logger.debug(f"Writing section marker {marker:#x} with size {size} at {position}")
-        self.alt_file.write(struct.pack("q", marker))  # 8 bytes
-        self.alt_file.write(struct.pack("q", size))  # 8 bytes
+        self.logger.debug("Writing section marker %#x with size %d at %d", marker, size, position)
+        self.alt_file.write(_S_2Q.pack(marker, size))
 
     def write_end_marker(self) -> None:
         """Write the end marker."""
         position = self.alt_file.tell()
-        self.logger.debug(f"Writing end marker at {position}")
-        self.alt_file.write(struct.pack("q", self.magic_type.END))  # Now 8 bytes for consistency
+        self.logger.debug("Writing end marker at %d", position)
+        self.alt_file.write(_S_Q.pack(self.magic_type.END))  # Now 8 bytes for consistency
 
 
 class MagicReader(BaseMagic):
@@ -146,27 +162,46 @@ class MagicReader(BaseMagic):
         padding_needed = self.calculate_padding()
         if padding_needed > 0:
             padding = self.alt_file.read(padding_needed)
-            if padding != b"\x00" * padding_needed:
+            if len(padding) != padding_needed:
+                raise ValueError(
+                    f"Truncated alignment padding: expected {padding_needed} bytes, "
+                    f"got {len(padding)}."
+                )
+            # A zero buffer converts to integer zero; no reference allocation
+            if int.from_bytes(padding, "little"):
                 raise ValueError("Alignment padding contains non-zero bytes.")
-            self.logger.debug(f"Skipped {padding_needed} bytes of padding.")
+            self.logger.debug("Skipped %d bytes of padding.", padding_needed)
 
     def read_section_marker(self) -> Tuple[int, int]:
         """Read a section marker and its size."""
-        marker = struct.unpack("q", self.alt_file.read(8))[0]
+        marker, size = _S_2Q.unpack(self.alt_file.read(16))
         if not self.magic_type.is_valid(marker):
             raise ValueError(f"Invalid section marker: {marker:#x}")
-        size = struct.unpack("q", self.alt_file.read(8))[0]
-        self.logger.debug(f"Read section marker: {marker:#x}, size: {size}")
+        self.logger.debug("Read section marker: %#x, size: %d", marker, size)
         return marker, size
 
     def read_end_marker(self) -> None:
         """Read the end marker."""
         # NOTE: This is **not** a section handler. It is a null terminator.
         self.read_alignment()
-        marker = struct.unpack("q", self.alt_file.read(8))[0]
+        marker = _S_Q.unpack(self.alt_file.read(8))[0]
         if not self.magic_type.is_end(marker):
             raise ValueError(f"Invalid end marker: {marker:#x}")
-        self.logger.debug(f"Valid end marker: {marker:#x}")
+        self.logger.debug("Valid end marker: %#x", marker)
+
+
+def get_magic_writer(cli_params: CLIParams) -> MagicWriter:
+    """Get the writer shared by every section bound to these CLI parameters."""
+    if cli_params.magic_writer is None:
+        cli_params.magic_writer = MagicWriter(cli_params)
+    return cli_params.magic_writer
+
+
+def get_magic_reader(cli_params: CLIParams) -> MagicReader:
+    """Get the reader shared by every section bound to these CLI parameters."""
+    if cli_params.magic_reader is None:
+        cli_params.magic_reader = MagicReader(cli_params)
+    return cli_params.magic_reader
 
 
 class MagicModel(BaseModel):
@@ -183,46 +218,45 @@ class MagicModel(BaseModel):
             raise IOError(f"Write access is not permitted: {self.filepath}")
 
         # Set the magic writer
-        self.writer = MagicWriter(self.cli_params)
+        self.writer = get_magic_writer(self.cli_params)
 
         # Write from start of file
         self.writer.alt_file.seek(0)
 
-        # Write the section marker and size
+        # Marker, size, version, and alignment form one fixed 24-byte record
         section_size = self.calculate_size()  # version + alignment = 8 bytes
-        self.writer.write_section_marker(self.magic_type.ALT, section_size)
-
-        # Write the fields: 4 byte for version and 4 bytes for alignment
-        self.writer.alt_file.write(struct.pack("i", self.magic_type.VERSION))
-        self.writer.alt_file.write(struct.pack("i", self.magic_type.ALIGNMENT))
-        self.logger.debug(f"Magic Section ends at position {self.alt_file.tell()}")
+        self.writer.alt_file.write(
+            _S_START.pack(
+                self.magic_type.ALT,
+                section_size,
+                self.magic_type.VERSION,
+                self.magic_type.ALIGNMENT,
+            )
+        )
+        self.logger.debug("Magic Section ends at position %d", self.alt_file.tell())
 
         # Write the alignment
         self.writer.write_alignment()
 
-    def read_model(self) -> OrderedDict[str, Any]:
+    def read_model(self) -> dict[str, Any]:
         """Read and validate the Start Marker."""
         # Check read permissions
         if not os.access(self.filepath, os.R_OK):
             raise IOError(f"Read access is not permitted: {self.filepath}")
 
         # Set the magic reader
-        self.reader = MagicReader(self.cli_params)
+        self.reader = get_magic_reader(self.cli_params)
 
         # Read from start of file
         self.alt_file.seek(0)
 
-        # Read the marker and size
-        marker, size = self.reader.read_section_marker()
+        # Read the whole 24-byte record: marker, size, version, alignment
+        marker, size, version, alignment = _S_START.unpack(self.alt_file.read(24))
         if not self.magic_type.is_alt(marker):
             raise ValueError(f"Invalid magic value: {marker}, Size: {size}")
 
-        metadata = OrderedDict()
-
-        # Read the version and alignment values
-        version = struct.unpack("i", self.alt_file.read(4))[0]
-        alignment = struct.unpack("i", self.alt_file.read(4))[0]
-        self.logger.debug(f"Magic Version: {version}, Magic Alignment: {alignment}")
+        metadata = {}
+        self.logger.debug("Magic Version: %d, Magic Alignment: %d", version, alignment)
         if not self.magic_type.is_version(version):
             raise ValueError(f"Invalid ALT version: {version}")
         if not self.magic_type.is_aligned(alignment):
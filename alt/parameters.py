@@ -46,7 +46,7 @@ The Parameters Section includes three main parts: **Header**, **Fields**, and **
 
 #### **Alignment**
 
-The section must align to the next 32-byte boundary using padding. Add `0x00` bytes as necessary to reach the required alignment.
+The section must align to the next 64-byte boundary using padding. Add `0x00` bytes as necessary to reach the required alignment.
 
 #### **Parsing Steps**
 
@@ -61,16 +61,42 @@ The section must align to the next 32-byte boundary using padding. Add `0x00` by
 4. **Calculate Derived Parameters**:
    - Compute any derived fields (e.g., `head_size`) based on the primary configuration fields.
 5. **Apply Alignment**:
-   - Add padding bytes (`0x00`) to ensure the section aligns with the next 32-byte boundary.
+   - Add padding bytes (`0x00`) to ensure the section aligns with the next 64-byte boundary.
 """
 
 import struct
-from collections import OrderedDict
+import sys
+import threading
 from typing import Any, Optional
 
 from alt.base import BaseModel, CLIParams
 from alt.loader import ModelLoader
-from alt.magic import MagicReader, MagicWriter
+from alt.magic import get_magic_reader, get_magic_writer
+
+# Precompiled little-endian structs; "<" pins the width and byte order so the
+# on-disk layout cannot drift with the platform
+_S_I = struct.Struct("<i")
+
+# Fixed tail after the length-prefixed activation string: bool, 8 int32
+# fields, 3 float32 fields, in write order
+_S_TAIL = struct.Struct("<?8i3f")
+# Reusable pack scratch per thread; batch exports allocate nothing per write
+_scratch = threading.local()
+
+_TAIL_FIELDS = (
+    "tie_word_embeddings",
+    "hidden_size",
+    "intermediate_size",
+    "max_position_embeddings",
+    "num_attention_heads",
+    "num_hidden_layers",
+    "num_key_value_heads",
+    "sliding_window",
+    "head_size",
+    "rms_norm_eps",
+    "rope_theta",
+    "initializer_range",
+)
 
 
 class ParametersModel(BaseModel):
@@ -107,60 +133,59 @@ class ParametersModel(BaseModel):
         self.head_size = self.hidden_size // self.num_attention_heads
 
         # Magic writer and reader
-        self.magic_writer = MagicWriter(cli_params)
-        self.magic_reader = MagicReader(cli_params)
+        self.magic_writer = get_magic_writer(cli_params)
+        self.magic_reader = get_magic_reader(cli_params)
+
+        # Specialized packer for the section's fixed layout: length-prefixed
+        # activation string, bool, 8 int32 fields, 3 float32 fields
+        self._packer = struct.Struct(f"<i{self.hidden_act_len}s?8i3f")
+
+        # The packer spans the whole section, so its size is the section size
+        self._size = self._packer.size
 
     def calculate_size(self) -> int:
         """
         Calculate the size of the Parameters Section.
         Each field is fixed-size (4 bytes for int32, 4 bytes for float32).
         """
-        size = 4 + self.hidden_act_len  # len and string
-        size += 1  # bool fields
-        size += 4 * 7  # int32 fields
-        size += 4 * 3  # float32 fields
-        size += 4  # 1 int32 derived field (head_size)
-        return size
+        return self._size
 
     def write_model(self) -> None:
         """
         Write the Parameters Section to the file.
         """
-        # Write section marker and size
-        self.magic_writer.write_section_marker(self.magic_type.PARAMETERS, self.calculate_size())
-
-        # Write fields
-        fields = [
-            (self.hidden_act_len, self.hidden_act),  # len + str
-            self.tie_word_embeddings,  # bool as int
-            self.hidden_size,  # int
-            self.intermediate_size,  # int
-            self.max_position_embeddings,  # int
-            self.num_attention_heads,  # int
-            self.num_hidden_layers,  # int
-            self.num_key_value_heads,  # int
-            self.sliding_window,  # int
-            self.head_size,  # int (derived field)
-            self.rms_norm_eps,  # float
-            self.rope_theta,  # float
-            self.initializer_range,  # float
-        ]
-        for value in fields:
-            if isinstance(value, bool):
-                self.alt_file.write(struct.pack("?", value))  # Write bool
-            elif isinstance(value, int):  # Short-circuit
-                self.alt_file.write(struct.pack("i", value))  # Write int32
-            elif isinstance(value, float):
-                self.alt_file.write(struct.pack("f", value))  # Write float32
-            elif isinstance(value, tuple):
-                k, v = value  # Unpack len and string
-                self.alt_file.write(struct.pack("i", k))  # len prefix
-                self.alt_file.write(v.encode("utf-8"))  # string data
-
-        # Write alignment padding
-        self.magic_writer.write_alignment()
-
-    def read_model(self) -> OrderedDict[str, Any]:
+        # Pack every field into the per-thread scratch buffer in one call;
+        # repeated exports reuse the buffer instead of allocating fresh bytes
+        need = self._size
+        buffer = getattr(_scratch, "buffer", None)
+        if buffer is None or len(buffer) < need:
+            _scratch.buffer = buffer = bytearray(max(need, 256))
+        self._packer.pack_into(
+            buffer,
+            0,
+            self.hidden_act_len,
+            self.hidden_act.encode("utf-8"),
+            self.tie_word_embeddings,
+            self.hidden_size,
+            self.intermediate_size,
+            self.max_position_embeddings,
+            self.num_attention_heads,
+            self.num_hidden_layers,
+            self.num_key_value_heads,
+            self.sliding_window,
+            self.head_size,
+            self.rms_norm_eps,
+            self.rope_theta,
+            self.initializer_range,
+        )
+
+        # Emit marker, packed fields, and alignment padding with one write
+        header = self.magic_writer.pack_section_marker(self.magic_type.PARAMETERS, need)
+        end = self.alt_file.tell() + len(header) + need
+        padding = self.magic_writer.pack_alignment(end)
+        self.alt_file.write(b"".join((header, memoryview(buffer)[:need], padding)))
+
+    def read_model(self) -> dict[str, Any]:
         """
         Read the Parameters Section from the file.
         """
@@ -168,51 +193,19 @@ class ParametersModel(BaseModel):
         marker, size = self.magic_reader.read_section_marker()
         if not self.magic_type.is_parameters(marker):
             raise ValueError(f"Invalid Parameters Section marker: {marker}")
-        if size != self.calculate_size():
-            raise ValueError(f"Section size mismatch: expected {self.calculate_size()}, got {size}")
-
-        # Read fields
-        str_t = [
-            "hidden_act",
-        ]
-        bool_t = [
-            "tie_word_embeddings",
-        ]
-        int_t = [
-            "hidden_size",
-            "intermediate_size",
-            "max_position_embeddings",
-            "num_attention_heads",
-            "num_hidden_layers",
-            "num_key_value_heads",
-            "sliding_window",
-            "head_size",  # Derived field
-        ]
-        float_t = [
-            "rms_norm_eps",
-            "rope_theta",
-            "initializer_range",
-        ]
-        fields = str_t + bool_t + int_t + float_t
-
-        metadata = OrderedDict()
-        for field in fields:
-            value = None  # reset value
-            if field in str_t:
-                length = struct.unpack("i", self.alt_file.read(4))[0]
-                value = self.alt_file.read(length).decode("utf-8")
-            elif field in bool_t:
-                value = struct.unpack("?", self.alt_file.read(1))[0]
-            elif field in int_t:
-                value = struct.unpack("i", self.alt_file.read(4))[0]
-            elif field in float_t:
-                value = struct.unpack("f", self.alt_file.read(4))[0]
-            else:
-                raise ValueError(
-                    "Unexpected value type. Supported types are str, bool, int, and float."
-                )
-            if value is None:
-                raise ValueError("Value is NoneType.")
+        expected = self._size
+        if size != expected:
+            raise ValueError(f"Section size mismatch: expected {expected}, got {size}")
+
+        # Read the whole section once, then parse the fields in memory
+        buffer = self.alt_file.read(size)
+        length = _S_I.unpack_from(buffer, 0)[0]
+
+        metadata = {}
+        # Interned: values like "silu" repeat across every loaded model
+        metadata["hidden_act"] = sys.intern(buffer[4 : 4 + length].decode("utf-8"))
+        # The remaining twelve fields are fixed-width; unpack them in one call
+        for field, value in zip(_TAIL_FIELDS, _S_TAIL.unpack_from(buffer, 4 + length)):
             metadata[field] = value
 
         # Read alignment padding
@@ -224,6 +217,7 @@ class ParametersModel(BaseModel):
 # Example Usage
 if __name__ == "__main__":
     import logging
+    import mmap
     from argparse import ArgumentParser
     from pathlib import Path
 
@@ -249,7 +243,9 @@ if __name__ == "__main__":
 
     # Write the ALT file
     logger.info("Writing the ALT file...")
-    with open(path / filename, "wb") as alt_write:
+    # Large write buffer: section writes accumulate in user space and reach
+    # the kernel in megabyte-sized chunks instead of one syscall per section
+    with open(path / filename, "wb", buffering=1 << 20) as alt_write:
         cli_params.alt_file = alt_write
 
         # Write Start Section
@@ -272,23 +268,27 @@ if __name__ == "__main__":
     # Read and validate the ALT file
     logger.info("Reading the ALT file...")
     with open(path / filename, "rb") as alt_read:
-        cli_params.alt_file = alt_read
+        # Map the file once; the section readers parse against the page cache
+        # instead of issuing a read syscall per field
+        with mmap.mmap(alt_read.fileno(), 0, access=mmap.ACCESS_READ) as alt_map:
+            cli_params.alt_file = alt_map
 
-        # Read and validate Start Section
-        magic_data = magic.read_model()
+            # Read and validate Start Section
+            magic_data = magic.read_model()
 
-        # Read and validate General Section
-        general_data = general.read_model()
+            # Read and validate General Section
+            general_data = general.read_model()
 
-        # Read and validate Parameters Section
-        hparams_data = hparams.read_model()
+            # Read and validate Parameters Section
+            hparams_data = hparams.read_model()
 
-        # Read and validate End Marker
-        magic.reader.read_end_marker()
+            # Read and validate End Marker
+            magic.reader.read_end_marker()
+        cli_params.alt_file = alt_read
 
     # Display General Section Metadata
     logger.info("General Section Metadata:")
-    metadata = OrderedDict()
+    metadata = {}
     metadata.update(magic_data)
     metadata.update(general_data)
     metadata.update(hparams_data)
@@ -0,0 +1,74 @@
+"""
+Module: alt/quant.py
+
+Group-wise symmetric quantization for the Tensor Section.
+
+Weights are quantized per group rather than per tensor so a single outlier
+cannot blow up the step size for the whole row. Each group of `group_size`
+consecutive values gets one float16 scale; the quantized values for the whole
+tensor are stored first and the scales follow as a separate contiguous array
+(struct of arrays), which is the layout a SIMD dequantization kernel wants to
+stream.
+
+- `QINT8`: one int8 per value, `value ~= q * scale` with `q` in [-127, 127].
+- `QINT4`: two values per byte, `q` in [-8, 7] biased to [0, 15] and packed as
+  `low | (high << 4)`, halving storage bandwidth again.
+"""
+
+import numpy as np
+
+# Default quantization group size; must divide the row length
+GROUP_SIZE = 128
+
+
+def _group_scales(row: np.ndarray, group_size: int, quant_range: int) -> np.ndarray:
+    """Compute one symmetric scale per group from the group's absolute maximum."""
+    if row.size % group_size != 0:
+        raise ValueError(f"Row size {row.size} is not divisible by group size {group_size}")
+    groups = row.reshape(-1, group_size)
+    scales = np.abs(groups).max(axis=1) / quant_range
+    # Avoid division by zero for all-zero groups; the quantized values are 0 anyway
+    scales[scales == 0.0] = 1.0
+    return scales
+
+
+def quantize_row_int8(row: np.ndarray, group_size: int = GROUP_SIZE) -> tuple:
+    """Quantize a row to int8 with one float16 scale per group."""
+    row = np.ascontiguousarray(row, dtype=np.float32)
+    scales = _group_scales(row, group_size, 127)
+    groups = row.reshape(-1, group_size)
+    q = np.round(groups / scales[:, None]).clip(-127, 127).astype(np.int8)
+    return q.reshape(-1), scales.astype(np.float16)
+
+
+def quantize_row_int4(row: np.ndarray, group_size: int = GROUP_SIZE) -> tuple:
+    """Quantize a row to packed int4 nibbles with one float16 scale per group."""
+    row = np.ascontiguousarray(row, dtype=np.float32)
+    scales = _group_scales(row, group_size, 7)
+    groups = row.reshape(-1, group_size)
+    q = np.round(groups / scales[:, None]).clip(-8, 7).astype(np.int8).reshape(-1)
+    # Bias [-8, 7] to [0, 15] and pack two nibbles per byte
+    biased = (q + 8).astype(np.uint8)
+    packed = (biased[0::2] | (biased[1::2] << 4)).astype(np.uint8)
+    return packed, scales.astype(np.float16)
+
+
+def dequantize_row_int8(
+    q: np.ndarray, scales: np.ndarray, group_size: int = GROUP_SIZE
+) -> np.ndarray:
+    """Reconstruct float32 values from int8 groups and their scales."""
+    groups = q.reshape(-1, group_size).astype(np.float32)
+    return (groups * scales.astype(np.float32)[:, None]).reshape(-1)
+
+
+def dequantize_row_int4(
+    packed: np.ndarray, scales: np.ndarray, group_size: int = GROUP_SIZE
+) -> np.ndarray:
+    """Reconstruct float32 values from packed int4 nibbles and their scales."""
+    low = (packed & 0x0F).astype(np.int8) - 8
+    high = (packed >> 4).astype(np.int8) - 8
+    q = np.empty(packed.size * 2, dtype=np.int8)
+    q[0::2] = low
+    q[1::2] = high
+    groups = q.reshape(-1, group_size).astype(np.float32)
+    return (groups * scales.astype(np.float32)[:, None]).reshape(-1)
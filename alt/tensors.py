@@ -118,13 +118,110 @@ And for a unique component (`lm_head.weight`):
 
 """
 
-from dataclasses import dataclass
+import numpy as np
 
 from alt.base import BaseModel, CLIParams, DataType, ProfileType
+from alt.quant import quantize_row_int4, quantize_row_int8
+
+# Fixed-width portion of the Per-Tensor Metadata as one packed record. Keeping
+# the records in a single structured array means the whole metadata block
+# moves to and from disk with one tofile()/fromfile() instead of a Python
+# loop per tensor. Variable-length fields (shape_dimensions, tensor_name)
+# stay length-prefixed next to each record as the spec above describes.
+TENSOR_META_DTYPE = np.dtype(
+    [
+        ("component_type", "<i4"),
+        ("block_index", "<i4"),
+        ("layer_type", "<i4"),
+        ("projection_type", "<i4"),
+        ("n_dims", "<i4"),
+        ("data_type", "<i4"),
+        ("delta", "<f4"),
+        ("min", "<f4"),
+        ("max", "<f4"),
+        ("packing_flag", "i1"),
+    ]
+)
 
 
 class Tensors(BaseModel):
     def __init__(self, cli_params: CLIParams):
         super().__init__(cli_params)
-        self.data_type = DataType()
-        self.profile_type = ProfileType()
+        self.data_type = DataType
+        self.profile_type = ProfileType
+        # Accumulated fixed-width metadata records, flushed in bulk
+        self.tensor_meta = []
+
+    def add_tensor_meta(
+        self,
+        component_type: int,
+        block_index: int,
+        layer_type: int,
+        projection_type: int,
+        n_dims: int,
+        data_type: int,
+        delta: float = 0.0,
+        minimum: float = 0.0,
+        maximum: float = 0.0,
+        packing_flag: int = 0,
+    ) -> None:
+        """Queue one tensor's fixed-width metadata record."""
+        self.tensor_meta.append(
+            (
+                component_type,
+                block_index,
+                layer_type,
+                projection_type,
+                n_dims,
+                data_type,
+                delta,
+                minimum,
+                maximum,
+                packing_flag,
+            )
+        )
+
+    def write_tensor_meta(self) -> None:
+        """Flush every queued metadata record with a single bulk write."""
+        np.array(self.tensor_meta, dtype=TENSOR_META_DTYPE).tofile(self.alt_file)
+
+    def read_tensor_meta(self, tensor_count: int) -> np.ndarray:
+        """Read the fixed-width metadata block for tensor_count tensors."""
+        return np.fromfile(self.alt_file, dtype=TENSOR_META_DTYPE, count=tensor_count)
+
+    def read_tensor_data(self, offset: int, shape: tuple, dtype: np.dtype) -> np.memmap:
+        """Expose one tensor's payload as a memmap view of the ALT file.
+
+        The OS demand-pages the weights on first touch instead of copying
+        them into the heap at load time, so peak memory stays at the working
+        set and warm runs serve straight from the page cache. The file
+        cursor is advanced past the payload for the next section reader.
+        """
+        data = np.memmap(self.filepath, dtype=dtype, mode="r", offset=offset, shape=shape)
+        self.alt_file.seek(offset + data.nbytes)
+        return data
+
+    def write_tensor_data(self, tensor) -> None:
+        """Serialize one tensor's payload as a single bulk write.
+
+        Weights are converted to the requested storage type in one numpy cast
+        (float16 halves the on-disk size of a float32 checkpoint) and dumped
+        with tofile(), one memcpy per tensor instead of per-element packing.
+        Quantized profiles store the values first and the group scales after
+        them; QINT4 packs two nibbles per byte (packing_flag = 1), halving
+        the bytes moved again.
+        """
+        array = tensor.detach().cpu().numpy()
+        data_type = self.cli_params.data_type
+        if data_type == DataType.QINT8:
+            values, scales = quantize_row_int8(array.reshape(-1))
+            values.tofile(self.alt_file)
+            scales.tofile(self.alt_file)
+        elif data_type == DataType.QINT4:
+            packed, scales = quantize_row_int4(array.reshape(-1))
+            packed.tofile(self.alt_file)
+            scales.tofile(self.alt_file)
+        elif data_type == DataType.FLOAT16:
+            array.astype(np.float16, copy=False).tofile(self.alt_file)
+        else:
+            array.astype(np.float32, copy=False).tofile(self.alt_file)
@@ -47,7 +47,7 @@ Each token in the vocabulary is stored sequentially and contains additional fiel
 
 ### **Alignment**
 
-The Tokenizer Section must align to the next 32-byte boundary after all tokens are written. Use `0x00` bytes for padding as needed.
+The Tokenizer Section must align to the next 64-byte boundary after all tokens are written. Use `0x00` bytes for padding as needed.
 
 ### **Parsing Steps**
 
@@ -63,7 +63,7 @@ The Tokenizer Section must align to the next 32-byte boundary after all tokens a
      - Extract `token_score` (e.g., log probability).
      - Retrieve `token_type` to classify the token.
 5. **Apply Alignment**:
-   - Add padding with `0x00` bytes if needed to reach the next 32-byte boundary.
+   - Add padding with `0x00` bytes if needed to reach the next 64-byte boundary.
 
 ### **Token Types**
 
@@ -106,16 +106,19 @@ Let's demonstrate a sample Tokenizer Section layout with three tokens, including
 | 0x48   | `token_data`     | "!"          | Variable     | UTF-8 encoded token string     |
 | 0x4C   | `token_score`    | `-1.0`       | 4            | Token score                    |
 | 0x50   | `token_type`     | `0x00000003` | 4            | Token type `NORMAL`            |
-| 0x54   | Padding          | `0x00`       | 12           | Pad to next 32-byte boundary   |
+| 0x54   | Padding          | `0x00`       | 44           | Pad to next 64-byte boundary   |
 """
 
 import struct
-from collections import OrderedDict
 from typing import Any
 
 from alt.base import BaseModel, CLIParams, TokenType
 from alt.loader import ModelLoader
-from alt.magic import MagicReader, MagicWriter
+from alt.magic import get_magic_reader, get_magic_writer
+
+# Precompiled little-endian structs shared by the write and read paths
+_S_5I = struct.Struct("<5i")
+_S_FIII = struct.Struct("<fiii")
 
 
 class TokenizerModel(BaseModel):
@@ -126,60 +129,89 @@ class TokenizerModel(BaseModel):
         self.processor = ModelLoader(cli_params).load_model_tokenizer()
         self.vocab_size = self.processor.vocab_size()
 
+        # Special token ids never change for a loaded processor; fetch them
+        # once instead of crossing the C boundary on every write
+        self.bos_id = self.processor.bos_id()
+        self.eos_id = self.processor.eos_id()
+        self.pad_id = self.processor.pad_id()
+        self.unk_id = self.processor.unk_id()
+
         # Create a token type object for identifying token types
         self.token_type = TokenType(self.processor)
 
+        # Cache for the materialized vocabulary entries and the section size
+        self._entries = None
+        self._section_size = None
+
         # Magic writer and reader
-        self.magic_writer = MagicWriter(cli_params)
-        self.magic_reader = MagicReader(cli_params)
+        self.magic_writer = get_magic_writer(cli_params)
+        self.magic_reader = get_magic_reader(cli_params)
+
+    def load_entries(self) -> list:
+        """Materialize (token_bytes, token_score, token_type) for every token once."""
+        if self._entries is None:
+            # Fetch all pieces with one batched call instead of one per token
+            token_ids = list(range(self.vocab_size))
+            pieces = self.processor.id_to_piece(token_ids)
+            get_score = self.processor.get_score
+            scores = [get_score(token_id) for token_id in token_ids]
+            types = self.token_type.get_types(pieces)
+            # map() runs the encode loop in C without per-item frame setup
+            tokens = list(map(str.encode, pieces))
+            self._entries = list(zip(tokens, scores, types))
+        return self._entries
 
     def calculate_size(self) -> int:
-        # Calculate the size of the tokenizer section
-        size = 4 * 5  # vocab_size, bos_id, eos_id, pad_id, unk_id
-        for index in range(self.vocab_size):
-            token = self.processor.id_to_piece(index)
-            token_bytes = token.encode("utf-8")
-            size += 4  # token_len
-            size += len(token_bytes)  # token_data
-            size += 4  # token_score
-            size += 4  # token_type
-        return size
+        # Metadata (vocab_size, bos_id, eos_id, pad_id, unk_id) plus, per token,
+        # the fixed 16-byte prefix (score, type, id, len) and the token bytes.
+        # The vocabulary is immutable after construction, so sum it once.
+        if self._section_size is None:
+            self._section_size = 4 * 5 + sum(
+                16 + len(token_bytes) for token_bytes, _, _ in self.load_entries()
+            )
+        return self._section_size
 
     def write_model(self) -> None:
         # Write the Tokenizer section_marker and section_size
-        self.magic_writer.write_section_marker(self.magic_type.TOKENIZER, self.calculate_size())
-
-        # vocab_size: 4 bytes
-        self.alt_file.write(struct.pack("i", self.vocab_size))
+        size = self.calculate_size()
+        self.magic_writer.write_section_marker(self.magic_type.TOKENIZER, size)
+
+        # The section size is known up front, so pack straight into a
+        # preallocated buffer at a running offset; no incremental growth
+        buffer = bytearray(size)
+
+        # vocab_size, bos_id, eos_id, pad_id, unk_id: each 4 bytes
+        _S_5I.pack_into(
+            buffer,
+            0,
+            self.vocab_size,
+            self.bos_id,
+            self.eos_id,
+            self.pad_id,
+            self.unk_id,
+        )
+        offset = 20
 
-        # bos_id, eos_id, pad_id, unk_id: each 4 bytes
-        self.alt_file.write(struct.pack("i", self.processor.bos_id()))
-        self.alt_file.write(struct.pack("i", self.processor.eos_id()))
-        self.alt_file.write(struct.pack("i", self.processor.pad_id()))
-        self.alt_file.write(struct.pack("i", self.processor.unk_id()))
+        # Cache one packer per token length; a vocabulary reuses a few dozen lengths
+        packers = {}
 
         # For each token in the vocabulary:
-        for token_id in range(self.vocab_size):
-            # Extract token related metadata
-            token = self.processor.id_to_piece(token_id)
-            token_score = self.processor.get_score(token_id)
-            token_type = self.token_type.get_type(token_id, token)
-            token_bytes = token.encode("utf-8")
+        for token_id, (token_bytes, token_score, token_type) in enumerate(self.load_entries()):
             token_len = len(token_bytes)
-            # Write token_score
-            self.alt_file.write(struct.pack("f", token_score))
-            # Write token_type
-            self.alt_file.write(struct.pack("i", token_type))
-            # Write token_id
-            self.alt_file.write(struct.pack("i", token_id))
-            # Write token_len and token_data
-            self.alt_file.write(struct.pack("i", token_len))
-            self.alt_file.write(token_bytes)
+            # Pack token_score, token_type, token_id, token_len, and token_data
+            packer = packers.get(token_len)
+            if packer is None:
+                packer = packers[token_len] = struct.Struct(f"<fiii{token_len}s")
+            packer.pack_into(buffer, offset, token_score, token_type, token_id, token_len, token_bytes)
+            offset += 16 + token_len
+
+        # Write the packed section with a single call
+        self.alt_file.write(buffer)
 
         # Add alignment padding
         self.magic_writer.write_alignment()
 
-    def read_model(self) -> OrderedDict[str, Any]:
+    def read_model(self) -> dict[str, Any]:
         """Reads the Tokenizer section from the ALT file."""
         # Align the section with the marker
         self.magic_reader.read_alignment()
@@ -188,40 +220,49 @@ class TokenizerModel(BaseModel):
         marker, size = self.magic_reader.read_section_marker()
         if not self.magic_type.is_tokenizer(marker):
             raise ValueError(f"Invalid Tokenizer Section marker: {marker}")
-        if size != self.calculate_size():
-            raise ValueError(f"Section size mismatch: expected {self.calculate_size()}, got {size}")
-
-        # Read vocab_size
-        vocab_size = struct.unpack("i", self.alt_file.read(4))[0]
-
-        # Read bos_id, eos_id, pad_id, unk_id
-        bos_id, eos_id, pad_id, unk_id = struct.unpack("4i", self.alt_file.read(16))
-
-        # Read tokens
-        vocab = []
-        for _ in range(vocab_size):
-            # Read token_score
-            token_score = struct.unpack("f", self.alt_file.read(4))[0]
-            # Read token_type
-            token_type = struct.unpack("i", self.alt_file.read(4))[0]
-            # Read token_id
-            token_id = struct.unpack("i", self.alt_file.read(4))[0]
-            # Read token_len
-            token_len = struct.unpack("i", self.alt_file.read(4))[0]
-            # Read token_data
-            token_data = self.alt_file.read(token_len).decode("utf-8")
-            # Store token information
-            token = OrderedDict(
-                score=token_score,
-                type=token_type,
-                id=token_id,
-                length=token_len,
-                data=token_data,
-            )
-            vocab.append(token)
+        expected = self.calculate_size()
+        if size != expected:
+            raise ValueError(f"Section size mismatch: expected {expected}, got {size}")
+
+        # Slurp the whole section with one read instead of 4 + 4 * vocab_size reads
+        buffer = memoryview(self.alt_file.read(size))
+
+        # Read vocab_size, bos_id, eos_id, pad_id, unk_id
+        vocab_size, bos_id, eos_id, pad_id, unk_id = _S_5I.unpack_from(buffer, 0)
+
+        # Read tokens into parallel columns instead of one dict per token. The
+        # payload is already consumed by the single read above, so the parse is
+        # skipped entirely unless the caller asked for the vocabulary.
+        scores = []
+        types = []
+        ids = []
+        lengths = []
+        data = []
+        if self.cli_params.verbose:
+            offset = 20
+            for _ in range(vocab_size):
+                # Read token_score, token_type, token_id, token_len
+                token_score, token_type, token_id, token_len = _S_FIII.unpack_from(buffer, offset)
+                offset += 16
+                scores.append(token_score)
+                types.append(token_type)
+                ids.append(token_id)
+                lengths.append(token_len)
+                # Read token_data; kept as raw UTF-8 bytes, decoded lazily by consumers
+                data.append(bytes(buffer[offset : offset + token_len]))
+                offset += token_len
+
+        # Store the vocabulary as a struct of arrays
+        vocab = dict(
+            score=scores,
+            type=types,
+            id=ids,
+            length=lengths,
+            data=data,
+        )
 
         # Construct the result
-        tokenizer_data = OrderedDict(
+        tokenizer_data = dict(
             vocab_size=vocab_size,
             bos_id=bos_id,
             eos_id=eos_id,
@@ -262,7 +303,7 @@ if __name__ == "__main__":
 
     # Write the ALT file
     logger.info("Writing the ALT file...")
-    with open(path / filename, "wb") as alt_write:
+    with open(path / filename, "wb", buffering=1 << 20) as alt_write:
         cli_params.alt_file = alt_write
 
         # Write Start Section
@@ -304,7 +345,7 @@ if __name__ == "__main__":
 
     # Display Metadata
     logger.info("Tokenizer Model Metadata:")
-    metadata = OrderedDict()
+    metadata = {}
     metadata.update(magic_data)
     metadata.update(general_data)
     metadata.update(hparams_data)
@@ -312,8 +353,8 @@ if __name__ == "__main__":
     for key, value in metadata.items():
         if "vocab" == key:
             if args.verbose:
-                for v in value:
-                    print(v)
+                for token in zip(*value.values()):
+                    print(token)
             continue
         print(f"{key}: {value}")
 
@@ -5,10 +5,14 @@ Script: examples/qk8.py
 import struct
 from random import random, seed
 
+# Precompiled structs; parsing the format string once instead of per call
+_S_F32 = struct.Struct("f")
+_S_U32 = struct.Struct("I")
+
 
 def float32_to_float8(value: float) -> int:
     # Extract IEEE-754 components
-    bits = struct.unpack("I", struct.pack("f", value))[0]
+    bits = _S_U32.unpack(_S_F32.pack(value))[0]
     sign = (bits >> 31) & 0x1
     exponent = (bits >> 23) & 0xFF
     mantissa = bits & 0x7FFFFF
@@ -30,7 +34,7 @@ def float32_to_float8(value: float) -> int:
     return float8
 
 
-def float8_to_float32(float8: int) -> float:
+def _decode_float8(float8: int) -> float:
     # Extract components from 8-bit representation
     sign = (float8 >> 7) & 0x1
     e_compressed = (float8 >> 4) & 0x7
@@ -43,25 +47,28 @@ def float8_to_float32(float8: int) -> float:
     # Expand exponent
     e_expanded = e_compressed - e_bias_8 + e_bias_32
 
-    # Expand mantissa
-    m_expanded = m_compressed / 16.0
+    # Assemble the IEEE-754 bit pattern directly, the inverse of the shifts
+    # in float32_to_float8: the 4-bit mantissa becomes the top mantissa bits
+    bits = (sign << 31) | (e_expanded << 23) | (m_compressed << 19)
+    return _S_F32.unpack(_S_U32.pack(bits))[0]
+
 
-    # Reconstruct float
-    value = ((-1) ** sign) * (2 ** (e_expanded - e_bias_32)) * (1 + m_expanded)
-    return struct.unpack("f", struct.pack("f", value))[0]
+# An 8-bit float has only 256 possible values, so decode each once at import
+# and serve lookups from the table afterwards
+_FLOAT8_TABLE = tuple(_decode_float8(float8) for float8 in range(256))
+
+
+def float8_to_float32(float8: int) -> float:
+    return _FLOAT8_TABLE[float8 & 0xFF]
 
 
 def sampler(max_elements: int, z: int) -> list[float]:
     assert max_elements > 0
     assert z >= 2
 
-    values = []
-    for i in range(max_elements):
-        # Generate a random value in the range [0, 1]
-        normalized: float = random()
-        # Map the normalized value to the range [-n, n-1]
-        values.append(-z + (normalized * (2 * z - 1)))
-    return values
+    # Map each normalized draw from [0, 1] to [-n, n-1]; the comprehension
+    # sizes the list once instead of growing it append by append
+    return [-z + (random() * (2 * z - 1)) for _ in range(max_elements)]
 
 
 def main():
@@ -14,7 +14,9 @@ from dataclasses import dataclass
 from random import random, seed
 
 
-@dataclass
+# Slots drop the per-instance __dict__, keeping the object close to the
+# plain C struct it mirrors
+@dataclass(slots=True)
 class Q8:
     scalar: float = 0.0
     alpha: float = 0.0
@@ -28,10 +30,10 @@ def quantize_scalar_q8(value: float) -> Q8:
     # Define the maximum possible integer range (example: [z_min, z_max])
     z_domain: int = 255
 
-    # Define the maximum possible real range (example: [r_min, r_max])
+    # Define the maximum possible real range; the range is symmetric
+    # ([-r_max, r_max]), so its width is simply twice the magnitude
     r_max = abs(value)
-    r_min = -r_max
-    r_domain = r_max - r_min
+    r_domain = r_max + r_max
 
     # Handle special case for zero input
     if r_domain == 0:
@@ -70,13 +72,9 @@ def sampler(max_elements: int, z: int) -> list[float]:
     assert max_elements > 0
     assert z >= 2
 
-    values = []
-    for i in range(max_elements):
-        # Generate a random value in the range [0, 1]
-        normalized: float = random()
-        # Map the normalized value to the range [-n, n-1]
-        values.append(-z + (normalized * (2 * z - 1)))
-    return values
+    # Map each normalized draw from [0, 1] to [-n, n-1]; the comprehension
+    # sizes the list once instead of growing it append by append
+    return [-z + (random() * (2 * z - 1)) for _ in range(max_elements)]
 
 
 def main():